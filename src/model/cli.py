@@ -1,24 +1,28 @@
 """Command-line interface for fetching crypto data."""
 from __future__ import annotations
 
-import argparse
+import json
 import logging
 import multiprocessing
+import os
+import re
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import List
+from types import SimpleNamespace
+from typing import List, Tuple
 
 from colorama import Fore, Style, init
 
 from model.crypto_data import (
     fetch_coin_info,
     fetch_ohlcv,
-    plot_buyback_chart,
+    render_csv_and_snippets,
     save_buyback_model,
-    save_selloff_snippets,
-    save_surge_snippets,
+    save_csv_and_snippets,
     save_liquidation_model,
-    save_to_csv,
 )
 
 
@@ -40,37 +44,266 @@ BASE_ART = [
 ]
 
 
-def print_banner() -> None:
-    """Render the static ASCII logo with coloured half-spheres."""
-    print("\033[H\033[2J", end="")
-    footer = [
-        "Paper Hands Model [Version 1.0]",
-        "\u00A9 Bitmaker L.L.C-FZ. All rights reserved.",
-        "",
+@lru_cache(maxsize=None)
+def _dist_dir() -> Path:
+    """Locate the dist directory once; resolve() costs several stat() calls."""
+    if getattr(sys, "frozen", False):
+        return Path(sys.executable).resolve().parent
+    return Path(__file__).resolve().parent.parent.parent / "dist"
+
+
+@lru_cache(maxsize=None)
+def _datasets_dir() -> Path:
+    path = _dist_dir() / "datasets"
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+# Fetched data is reused for this long between runs of the same ticker, so
+# re-entering the CLI (e.g. buyback then liquidation) skips the REST traffic.
+CACHE_TTL_SECONDS = 300
+
+
+def _run_cache_path(cache_dir: Path, ticker: str) -> Path:
+    bucket = int(time.time() // CACHE_TTL_SECONDS)
+    return cache_dir / f"{ticker.lower()}_{bucket}.json"
+
+
+def _load_cached_run(cache_dir: Path, ticker: str):
+    """Return cached (info, ohlcv_map, failures) for this TTL bucket, or None."""
+    path = _run_cache_path(cache_dir, ticker)
+    try:
+        with open(path) as f:
+            payload = json.load(f)
+        return payload["info"], payload["ohlcv"], payload["failures"]
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def _store_cached_run(cache_dir: Path, ticker: str, info, ohlcv_map, failures) -> None:
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    payload = {"info": info, "ohlcv": ohlcv_map, "failures": failures}
+    try:
+        with open(_run_cache_path(cache_dir, ticker), "w") as f:
+            json.dump(payload, f)
+    except OSError as exc:
+        logging.debug("Could not write run cache: %s", exc)
+
+
+# Shared state for snippet-pool workers, set once per process by
+# _init_worker so every task doesn't re-pickle the same coin info.
+_INFO: dict = {}
+_SUPPLY: float = 0.0
+
+
+def _init_worker(info: dict, supply: float) -> None:
+    global _INFO, _SUPPLY
+    _INFO, _SUPPLY = info, supply
+
+
+def _run_surge(args: Tuple) -> float:
+    """Worker: write one exchange's data CSV and surge snippets in one pass."""
+    data_filename, snippet_filename, data, multiplier = args
+    return save_csv_and_snippets(
+        data_filename, snippet_filename, _INFO, data, _SUPPLY, multiplier, kind="surge"
+    )
+
+
+def _run_selloff(args: Tuple) -> float:
+    """Worker: write one exchange's data CSV and selloff snippets in one pass."""
+    data_filename, snippet_filename, data, multiplier = args
+    return save_csv_and_snippets(
+        data_filename,
+        snippet_filename,
+        _INFO,
+        data,
+        _SUPPLY,
+        multiplier,
+        kind="selloff",
+    )
+
+
+def _render_pack(args: Tuple) -> Tuple[str, str, str, float]:
+    """Worker for --pack: render one exchange's CSVs in memory."""
+    ex, data, multiplier, kind = args
+    data_text, snippet_text, avg = render_csv_and_snippets(
+        _INFO, data, _SUPPLY, multiplier, kind
+    )
+    return ex, data_text, snippet_text, avg
+
+
+def _generate_outputs(
+    ohlcv_map: dict,
+    info: dict,
+    supply: float,
+    ratio: float,
+    prefix: str,
+    base: str,
+    kind: str,
+    pack: bool,
+) -> List[float]:
+    """Write every exchange's data CSV and snippets; return the PH averages.
+
+    Each exchange's output is independent, so the CPU-bound scans are fanned
+    out across processes instead of running serially. The worker streams the
+    OHLCV rows once, emitting the data CSV and the snippet windows from the
+    same pass. With ``pack=True`` the workers render the CSVs in memory and
+    the main process bundles them into a single uncompressed ``.zip``, trading
+    2×N loose files for one archive write on bulk runs.
+    """
+    suffix = "surges" if kind == "surge" else "selloffs"
+    if pack:
+        tasks = [(ex, data, ratio, kind) for ex, data in ohlcv_map.items()]
+        with ProcessPoolExecutor(
+            max_workers=min(len(tasks), os.cpu_count() or 1),
+            initializer=_init_worker,
+            initargs=(info, supply),
+        ) as pool:
+            rendered = list(pool.map(_render_pack, tasks))
+        # Imported here so the common loose-file path never loads zipfile.
+        import zipfile
+
+        # Name the archive per kind so a surge run and a liquidation run for
+        # the same ticker don't overwrite each other.
+        with zipfile.ZipFile(f"{prefix}_{suffix}.zip", "w", zipfile.ZIP_STORED) as zf:
+            for ex, data_text, snippet_text, _avg in rendered:
+                zf.writestr(f"{base}_{ex}_data.csv", data_text)
+                zf.writestr(f"{base}_{ex}_{suffix}.csv", snippet_text)
+        return [r[3] for r in rendered]
+
+    runner = _run_surge if kind == "surge" else _run_selloff
+    tasks = [
+        (
+            Path(f"{prefix}_{ex}_data.csv"),
+            Path(f"{prefix}_{ex}_{suffix}.csv"),
+            data,
+            ratio,
+        )
+        for ex, data in ohlcv_map.items()
     ]
+    with ProcessPoolExecutor(
+        max_workers=min(len(tasks), os.cpu_count() or 1),
+        initializer=_init_worker,
+        initargs=(info, supply),
+    ) as pool:
+        return list(pool.map(runner, tasks))
+
+
+BANNER_FOOTER = [
+    "Paper Hands Model [Version 1.0]",
+    "\u00A9 Bitmaker L.L.C-FZ. All rights reserved.",
+    "",
+]
+
+
+def _colour_banner() -> str:
+    """Colour the ASCII logo's half-spheres and join it into one string."""
     width = max(len(line) for line in BASE_ART)
     midpoint = width // 2
     mid_row = len(BASE_ART) // 2
 
     def colour_line(row: int, text: str) -> str:
+        # Tag whole runs of identical glyphs instead of every character;
+        # only '=' runs straddling the midpoint need to be split.
         coloured = []
-        for col, ch in enumerate(text.ljust(width)):
-            if ch == " ":
-                coloured.append(" ")
-            elif ch == "=":
-                colour = Fore.CYAN if col < midpoint else Fore.LIGHTRED_EX
-                coloured.append(colour + ch)
-            elif ch == "-" and row <= mid_row:
-                coloured.append(Fore.CYAN + ch)
+        for match in re.finditer(r" +|=+|-+|[^ =-]+", text.ljust(width)):
+            seg = match.group()
+            start = match.start()
+            if seg[0] == " ":
+                coloured.append(seg)
+            elif seg[0] == "=":
+                cut = min(max(midpoint - start, 0), len(seg))
+                if cut:
+                    coloured.append(Fore.CYAN + seg[:cut])
+                if cut < len(seg):
+                    coloured.append(Fore.LIGHTRED_EX + seg[cut:])
+            elif seg[0] == "-" and row <= mid_row:
+                coloured.append(Fore.CYAN + seg)
             else:
-                coloured.append(Fore.WHITE + ch)
+                coloured.append(Fore.WHITE + seg)
         return "".join(coloured)
 
-    for row, line in enumerate(BASE_ART):
-        print(colour_line(row, line))
-    for line in footer:
-        print(Fore.CYAN + line)
-    print()
+    lines = [colour_line(row, line) for row, line in enumerate(BASE_ART)]
+    lines.extend(Fore.CYAN + line for line in BANNER_FOOTER)
+    return "\n".join(lines) + "\n"
+
+
+# The banner never changes, so pay the per-character colouring cost once at
+# import and emit the finished string with a single write per call.
+_BANNER_STR = _colour_banner()
+
+
+def print_banner() -> None:
+    """Render the static ASCII logo with coloured half-spheres.
+
+    When stdout is not a terminal (redirected to a file or pipe) or the user
+    set ``NO_COLOR``, the ANSI codes are wasted bytes; emit the plain art.
+    """
+    if os.environ.get("NO_COLOR") or not sys.stdout.isatty():
+        sys.stdout.write(
+            "\n".join(BASE_ART) + "\n" + "\n".join(BANNER_FOOTER) + "\n\n"
+        )
+        return
+    sys.stdout.write("\033[H\033[2J" + _BANNER_STR + "\n")
+
+
+def _parse_args(argv: List[str]):
+    """Parse command-line arguments, returning ``(args, unknown)``.
+
+    The overwhelmingly common invocation is ``crypto-fetch <ticker>`` with at
+    most a couple of known flags; hand-parse that shape and only fall back to
+    (and import) argparse for ``--help`` or anything unrecognised.
+    """
+    parsed = SimpleNamespace(
+        ticker=None, output=None, debug=False, no_cache=False, pack=False
+    )
+    positional: List[str] = []
+    simple = True
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        if arg == "--debug":
+            parsed.debug = True
+        elif arg == "--no-cache":
+            parsed.no_cache = True
+        elif arg == "--pack":
+            parsed.pack = True
+        elif (
+            arg == "--output"
+            and i + 1 < len(argv)
+            and not argv[i + 1].startswith("-")
+        ):
+            i += 1
+            parsed.output = argv[i]
+        elif arg.startswith("--output="):
+            parsed.output = arg.split("=", 1)[1]
+        elif arg.startswith("-"):
+            simple = False
+            break
+        else:
+            positional.append(arg)
+        i += 1
+    if simple and len(positional) <= 1:
+        parsed.ticker = positional[0] if positional else None
+        return parsed, []
+
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Fetch token info and OHLCV data")
+    parser.add_argument("ticker", nargs="?", help="Token ticker symbol, e.g. btc")
+    parser.add_argument("--output", default=None, help="Output CSV filename")
+    parser.add_argument("--debug", action="store_true", help="Enable debug logging")
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore cached fetch results and hit the network",
+    )
+    parser.add_argument(
+        "--pack",
+        action="store_true",
+        help="Bundle the per-exchange CSVs into a single uncompressed .zip",
+    )
+    return parser.parse_known_args(argv)
 
 
 def main() -> None:
@@ -81,58 +314,84 @@ def main() -> None:
     GRAY = Fore.LIGHTBLACK_EX
     WHITE = Fore.WHITE
 
-    def console(text: str = "", end: str = "\n") -> None:
-        print(GRAY + text + Style.RESET_ALL, end=end)
+    pending: List[str] = []
+
+    def console(text: str = "", end: str = "\n", batch: bool = False) -> None:
+        # batch=True queues the line; the next plain call emits the whole
+        # block with one write instead of one per line.
+        line = GRAY + text + Style.RESET_ALL + end
+        if batch:
+            pending.append(line)
+            return
+        if pending:
+            pending.append(line)
+            sys.stdout.write("".join(pending))
+            pending.clear()
+        else:
+            sys.stdout.write(line)
 
     def prompt(text: str) -> str:
         return input(GRAY + text + Style.RESET_ALL + WHITE)
 
-    parser = argparse.ArgumentParser(description="Fetch token info and OHLCV data")
-    parser.add_argument("ticker", nargs="?", help="Token ticker symbol, e.g. btc")
-    parser.add_argument("--output", default=None, help="Output CSV filename")
-    parser.add_argument("--debug", action="store_true", help="Enable debug logging")
-    args, _unknown = parser.parse_known_args()
+    args, _unknown = _parse_args(sys.argv[1:])
 
     logging.basicConfig(level=logging.DEBUG if args.debug else logging.INFO)
     if _unknown:
         logging.debug("Ignoring extra args: %s", _unknown)
 
+    if args.no_cache:
+        # The flag promises fresh network data, so it must defeat the on-disk
+        # layers in crypto_data (HTTP, symbols, OHLCV) too, not just the
+        # 5-minute run cache below; they all key off this env var.
+        os.environ["PH_NO_CACHE"] = "1"
+
     ticker = args.ticker or prompt("Enter token ticker: ").strip()
+    # Normalise both casings once; they're reused in messages, filenames and
+    # cache keys, and passing the lowercase form keeps the fetchers' caches
+    # keyed consistently.
+    ticker_l = ticker.lower()
+    ticker_u = ticker.upper()
+
+    datasets_dir = _datasets_dir()
+    cache_dir = _dist_dir() / "cache"
 
     warns: List[str] = []
-    try:
-        info = fetch_coin_info(ticker)
-        ohlcv_map, failures = fetch_ohlcv(ticker, progress=True, warnings=warns)
-    except ValueError as exc:
-        console(str(exc))
-        return
+    cached = None if args.no_cache else _load_cached_run(cache_dir, ticker_l)
+    if cached is not None:
+        info, ohlcv_map, failures = cached
+        console(f"Using cached data for {ticker_u}")
+    else:
+        try:
+            info = fetch_coin_info(ticker_l)
+            ohlcv_map, failures = fetch_ohlcv(
+                ticker_l, progress=True, warnings=warns, workers=16
+            )
+        except ValueError as exc:
+            console(str(exc))
+            return
+        if ohlcv_map:
+            _store_cached_run(cache_dir, ticker_l, info, ohlcv_map, failures)
 
     if not ohlcv_map:
         console("No OHLCV data available")
         return
 
-    if getattr(sys, "frozen", False):
-        dist_dir = Path(sys.executable).resolve().parent
-    else:
-        dist_dir = Path(__file__).resolve().parent.parent.parent / "dist"
-    datasets_dir = dist_dir / "datasets"
-    datasets_dir.mkdir(parents=True, exist_ok=True)
-
-    base = args.output or ticker.upper()
+    base = args.output or ticker_u
     if base.lower().endswith(".csv"):
         base = base[:-4]
-    for ex, data in ohlcv_map.items():
-        filename = datasets_dir / f"{base}_{ex}_data.csv"
-        save_to_csv(filename, info, data)
+    # Join datasets_dir/base once; per-exchange paths are derived from this
+    # string instead of re-joining the same components in every loop.
+    prefix = str(datasets_dir / base)
 
     console(
-        f"{ticker.upper()} data for {len(ohlcv_map)} exchanges successfully fetched, "
-        f"{len(failures)} exchanges failed. Files saved to {datasets_dir}"
+        f"{ticker_u} data for {len(ohlcv_map)} exchanges successfully fetched, "
+        f"{len(failures)} exchanges failed."
     )
     if warns:
-        console("Warnings:")
-        for msg in warns:
-            console(f"  - {msg}")
+        console("Warnings:", batch=True)
+        for msg in warns[:-1]:
+            console(f"  - {msg}", batch=True)
+        console(f"  - {warns[-1]}")
 
     mode = prompt("Select mode: buyback or liquidation (b/l): ").strip().lower()
     if mode.startswith("b"):
@@ -146,34 +405,41 @@ def main() -> None:
             console("Invalid numeric input")
             return
         surge_pct = abs(surge_pct)
-        avgs = []
-        for ex, data in ohlcv_map.items():
-            surge_filename = datasets_dir / f"{base}_{ex}_surges.csv"
-            avg = save_surge_snippets(
-                surge_filename,
-                data,
-                info["circulating_supply"],
-                1 + surge_pct / 100,
+        supply = info["circulating_supply"]
+        ratio = 1 + surge_pct / 100
+
+        def _generate_snippets() -> List[float]:
+            return _generate_outputs(
+                ohlcv_map, info, supply, ratio, prefix, base, "surge", args.pack
             )
-            avgs.append(avg)
+
+        # Kick the snippet pool off in the background and collect the
+        # remaining prompts while it runs; typing time is otherwise dead time.
+        with ThreadPoolExecutor(max_workers=1) as bg:
+            snippets = bg.submit(_generate_snippets)
+            try:
+                console()
+                final_price = float(prompt("Final desired price for buyback: "))
+                console()
+                q_pct = float(prompt("Increase in sell rate q percentage: "))
+                console()
+                step_input = prompt(
+                    "Price step percentage for schedule (default 5): "
+                ).strip()
+                step_pct = float(step_input) if step_input else 5.0
+            except ValueError:
+                console("Invalid numeric input")
+                return
+            avgs = snippets.result()
         avg = sum(avgs) / len(avgs) if avgs else 0.0
         console(f"Average PH percentage: {avg}")
+        if args.pack:
+            console(f"Files saved to {prefix}_surges.zip")
+        else:
+            console(f"Files saved to {datasets_dir}")
 
-        try:
-            console()
-            final_price = float(prompt("Final desired price for buyback: "))
-            console()
-            q_pct = float(prompt("Increase in sell rate q percentage: "))
-            console()
-            step_input = prompt(
-                "Price step percentage for schedule (default 5): "
-            ).strip()
-            step_pct = float(step_input) if step_input else 5.0
-        except ValueError:
-            console("Invalid numeric input")
-            return
-        buyback_filename = datasets_dir / f"{base}_buyback.csv"
-        save_buyback_model(
+        buyback_filename = Path(f"{prefix}_buyback.csv")
+        schedule = save_buyback_model(
             buyback_filename,
             info["price"],
             info["circulating_supply"],
@@ -183,8 +449,12 @@ def main() -> None:
             step_pct,
         )
         console(f"Buyback model written to {buyback_filename}")
-        chart_file = datasets_dir / f"{base}_buyback.png"
-        plot_buyback_chart(buyback_filename, chart_file)
+        # Imported here so runs that never chart (liquidation mode, CSV-only
+        # sessions) don't pay the matplotlib import cost at startup.
+        from model.crypto_data import plot_buyback_chart
+
+        chart_file = Path(f"{prefix}_buyback.png")
+        plot_buyback_chart(buyback_filename, chart_file, rows=schedule)
         console(f"Buyback chart written to {chart_file}")
     elif mode.startswith("l"):
         try:
@@ -201,33 +471,38 @@ def main() -> None:
                 f"Interpreting {selloff_pct}% as -{selloff_pct}% (selloff percentages should be negative)."
             )
         selloff_pct = -abs(selloff_pct)
-        avgs = []
-        for ex, data in ohlcv_map.items():
-            selloff_filename = datasets_dir / f"{base}_{ex}_selloffs.csv"
-            avg = save_selloff_snippets(
-                selloff_filename,
-                data,
-                info["circulating_supply"],
-                1 + selloff_pct / 100,
+        supply = info["circulating_supply"]
+        ratio = 1 + selloff_pct / 100
+
+        def _generate_snippets() -> List[float]:
+            return _generate_outputs(
+                ohlcv_map, info, supply, ratio, prefix, base, "selloff", args.pack
             )
-            avgs.append(avg)
+
+        with ThreadPoolExecutor(max_workers=1) as bg:
+            snippets = bg.submit(_generate_snippets)
+            try:
+                console()
+                final_price = float(prompt("Final desired price for liquidation: "))
+                console()
+                q_pct = float(prompt("Increase in sell buy rate q percentage: "))
+                console()
+                step_input = prompt(
+                    "Price step percentage for schedule (default 5): "
+                ).strip()
+                step_pct = float(step_input) if step_input else 5.0
+            except ValueError:
+                console("Invalid numeric input")
+                return
+            avgs = snippets.result()
         avg = sum(avgs) / len(avgs) if avgs else 0.0
         console(f"Average PH percentage: {avg}")
+        if args.pack:
+            console(f"Files saved to {prefix}_selloffs.zip")
+        else:
+            console(f"Files saved to {datasets_dir}")
 
-        try:
-            console()
-            final_price = float(prompt("Final desired price for liquidation: "))
-            console()
-            q_pct = float(prompt("Increase in sell buy rate q percentage: "))
-            console()
-            step_input = prompt(
-                "Price step percentage for schedule (default 5): "
-            ).strip()
-            step_pct = float(step_input) if step_input else 5.0
-        except ValueError:
-            console("Invalid numeric input")
-            return
-        liquidation_filename = datasets_dir / f"{base}_liquidation.csv"
+        liquidation_filename = Path(f"{prefix}_liquidation.csv")
         save_liquidation_model(
             liquidation_filename,
             info["price"],
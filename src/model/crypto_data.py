@@ -1,16 +1,22 @@
 """Utilities to fetch cryptocurrency data."""
 from __future__ import annotations
 
-import csv
+import hashlib
+import json
 import logging
 import math
+import os
 import sys
-from datetime import datetime, timezone
+import threading
+import time
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from functools import lru_cache
+from pathlib import Path
 from typing import Dict, List, Tuple
 
 
-import ccxt
+import numpy as np
 import requests
 from colorama import Fore, Style
 
@@ -20,12 +26,77 @@ except Exception:  # pragma: no cover - fallback when tqdm is missing
     def tqdm(iterable, **_):
         return iterable
 
+try:
+    import orjson
+except Exception:  # pragma: no cover - stdlib json is always available
+    orjson = None
+
+# Importing ccxt materialises ~150 exchange classes and costs on the order
+# of a second; defer it until fetch_ohlcv actually needs it so cache-served
+# runs and the pure CoinGecko helpers start instantly.
+ccxt = None
+
+
+def _ensure_ccxt():
+    global ccxt
+    if ccxt is None:
+        import ccxt as _ccxt
+
+        ccxt = _ccxt
+    return ccxt
+
 
 COINGECKO_API = "https://api.coingecko.com/api/v3"
 
+# One shared session keeps the TLS connection to CoinGecko alive across the
+# coin-list, coin-info and tickers requests instead of paying a TCP + TLS
+# handshake for each bare requests.get call. Transient upstream hiccups
+# (rate limits, gateway errors) are retried with backoff instead of
+# surfacing straight to the user.
+SESSION = requests.Session()
+SESSION.mount(
+    "https://",
+    requests.adapters.HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=10,
+        max_retries=requests.adapters.Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 502, 503, 504],
+            # Hand the final failed response back instead of raising
+            # RetryError, so exhausted retries still flow through
+            # raise_for_status() into the HTTPError handlers.
+            raise_on_status=False,
+        ),
+    ),
+)
+
 MS_IN_DAY = 24 * 60 * 60 * 1000
 DAYS_LIMIT = 364
 
+# Buffer size for CSV output files.  The default 8 KiB text-layer buffer
+# produces a write() syscall every few hundred rows; a 1 MiB buffer coalesces
+# a whole typical output into one or two writes.
+WRITE_BUFFER_BYTES = 1 << 20
+
+
+def _write_csv_text(filename, text: str) -> None:
+    """Write ``text`` to ``filename``, skipping files that already match.
+
+    Re-runs with the same ticker and parameters regenerate byte-identical
+    CSVs; comparing a blake2b digest of the rendered text against the
+    existing file skips the rewrite (and the mtime churn) on those repeats.
+    """
+    digest = hashlib.blake2b(text.encode()).digest()
+    try:
+        with open(filename, "rb") as f:
+            if hashlib.blake2b(f.read()).digest() == digest:
+                return
+    except OSError:
+        pass
+    with open(filename, "w", newline="", buffering=WRITE_BUFFER_BYTES) as f:
+        f.write(text)
+
 
 # CoinGecko only accepts a limited set of "days" parameters for its OHLC
 # endpoint.  Use the smallest allowed value greater than or equal to the
@@ -34,12 +105,13 @@ DAYS_LIMIT = 364
 COINGECKO_ALLOWED_DAYS = [1, 7, 14, 30, 90, 180, 365, 730]
 
 
+@lru_cache(maxsize=16)
 def _coingecko_days(limit: int) -> int:
     """Return a valid ``days`` value for CoinGecko's OHLC endpoint."""
 
-    for day in COINGECKO_ALLOWED_DAYS:
-        if limit <= day:
-            return day
+    i = bisect_left(COINGECKO_ALLOWED_DAYS, limit)
+    if i < len(COINGECKO_ALLOWED_DAYS):
+        return COINGECKO_ALLOWED_DAYS[i]
     return COINGECKO_ALLOWED_DAYS[-1]
 
 
@@ -63,7 +135,7 @@ EXCHANGE_ALIASES = {
 # Quote currencies considered "dollar" variations. Only markets using one of
 # these as the quote currency will be fetched. This avoids cross pairs such as
 # ``LTC/BTC`` or fiat pairs like ``BTC/JPY``.
-ALLOWED_QUOTES = {
+ALLOWED_QUOTES = frozenset({
     "USD",
     "USDT",
     "USDC",
@@ -74,15 +146,17 @@ ALLOWED_QUOTES = {
     "USDP",
     "PAX",
     "GUSD",
-}
+})
 
 
+@lru_cache(maxsize=256)
 def _normalize_exchange_id(exchange_id: str) -> str:
     """Normalise CoinGecko market identifiers for ccxt."""
 
     return EXCHANGE_ALIASES.get(exchange_id.lower(), exchange_id.lower())
 
 
+@lru_cache(maxsize=512)
 def _normalize_pair(exchange_id: str, pair: str) -> str:
     """Normalize trading pairs for specific exchanges."""
 
@@ -91,10 +165,245 @@ def _normalize_pair(exchange_id: str, pair: str) -> str:
     return pair
 
 
+# When CoinGecko reports no markets at all, probing every ccxt exchange is a
+# network storm; try the major venues first and settle for the first hit.
+PREFERRED_EXCHANGES = (
+    "binance",
+    "okx",
+    "kucoin",
+    "bybit",
+    "kraken",
+    "coinbase",
+    "bitstamp",
+)
+
+
 logger = logging.getLogger(__name__)
 
+# Home-the-cursor + clear-screen, emitted in one write after a coin is chosen.
+_CLEAR_SCREEN = "\033[H\033[2J"
+
+
+# CoinGecko metadata (the full coin list, per-coin info and tickers) changes
+# slowly; keep responses on disk for this long so repeated CLI runs skip the
+# round trips entirely. Set PH_NO_CACHE to force fresh requests.
+HTTP_CACHE_TTL_SECONDS = 6 * 60 * 60
+
 
 @lru_cache(maxsize=None)
+def _http_cache_dir() -> Path:
+    if getattr(sys, "frozen", False):
+        return Path(sys.executable).resolve().parent / "cache" / "http"
+    return Path(__file__).resolve().parent.parent.parent / "dist" / "cache" / "http"
+
+
+def _parse_json(resp):
+    """Parse a response body, preferring orjson when it is installed.
+
+    orjson parses the multi-megabyte ``/coins/list`` payload 2-3× faster
+    than stdlib json. It needs the raw bytes, so fall back to ``resp.json()``
+    for response objects without a ``content`` attribute.
+    """
+    if orjson is not None:
+        content = getattr(resp, "content", None)
+        if content is not None:
+            return orjson.loads(content)
+    return resp.json()
+
+
+def _cached_json(url: str, params: Dict | None = None):
+    """GET ``url`` and return its parsed JSON, caching the payload on disk.
+
+    The `/coins/list` response alone is several megabytes and is re-fetched
+    on every invocation otherwise. Cache files are keyed by the API path
+    (plus any query ``params``) and refreshed once older than
+    ``HTTP_CACHE_TTL_SECONDS``; any cache I/O error simply falls through to
+    a normal request.
+    """
+    use_cache = not os.environ.get("PH_NO_CACHE")
+    path = None
+    if use_cache:
+        key = url.replace(COINGECKO_API, "").strip("/").replace("/", "_") or "root"
+        if params:
+            key += "_" + "_".join(f"{k}-{params[k]}" for k in sorted(params))
+        path = _http_cache_dir() / f"{key}.json"
+        try:
+            if time.time() - path.stat().st_mtime < HTTP_CACHE_TTL_SECONDS:
+                if orjson is not None:
+                    return orjson.loads(path.read_bytes())
+                with open(path) as f:
+                    return json.load(f)
+        except (OSError, ValueError):
+            pass
+    if params is not None:
+        resp = SESSION.get(url, params=params, timeout=30)
+    else:
+        resp = SESSION.get(url, timeout=30)
+    resp.raise_for_status()
+    payload = _parse_json(resp)
+    if use_cache:
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, "w") as f:
+                json.dump(payload, f)
+        except OSError as exc:
+            logger.debug("Could not write HTTP cache for %s: %s", url, exc)
+    return payload
+
+
+# Exchange symbol listings churn slowly; remember them for a day so the
+# generic-pair fallback can rule exchanges out without a load_markets call.
+SYMBOLS_CACHE_TTL_SECONDS = 24 * 60 * 60
+
+
+def _symbols_cache_path(ex_name: str) -> Path:
+    return _http_cache_dir().parent / "symbols" / f"{ex_name}.json"
+
+
+def _cached_symbols(ex_name: str):
+    """Return the cached symbol set for an exchange, or ``None`` on miss."""
+    if os.environ.get("PH_NO_CACHE"):
+        return None
+    path = _symbols_cache_path(ex_name)
+    try:
+        if time.time() - path.stat().st_mtime < SYMBOLS_CACHE_TTL_SECONDS:
+            with open(path) as f:
+                return set(json.load(f))
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def _store_symbols(ex_name: str, symbols) -> None:
+    if os.environ.get("PH_NO_CACHE") or not symbols:
+        return
+    path = _symbols_cache_path(ex_name)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(sorted(symbols), f)
+    except OSError as exc:
+        logger.debug("Could not write symbols cache for %s: %s", ex_name, exc)
+
+
+# Daily candles only gain one new bar per day, so cache each successful
+# (exchange, symbol) download keyed by today's UTC date; a second run on the
+# same day serves the whole 364-day history without touching the network.
+
+
+def _ohlcv_cache_path(ex_name: str, symbol: str) -> Path:
+    day = time.strftime("%Y%m%d", time.gmtime())
+    safe = symbol.replace("/", "-")
+    return _http_cache_dir().parent / "ohlcv" / f"{ex_name}_{safe}_{day}.json"
+
+
+def _cached_ohlcv(ex_name: str, symbol: str):
+    """Return today's cached OHLCV rows for a pair, or ``None`` on miss."""
+    if os.environ.get("PH_NO_CACHE"):
+        return None
+    path = _ohlcv_cache_path(ex_name, symbol)
+    try:
+        if orjson is not None:
+            return orjson.loads(path.read_bytes())
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _store_ohlcv(ex_name: str, symbol: str, rows: List[List[float]]) -> None:
+    if os.environ.get("PH_NO_CACHE") or not rows:
+        return
+    path = _ohlcv_cache_path(ex_name, symbol)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(rows, f)
+    except OSError as exc:
+        logger.debug("Could not cache OHLCV for %s %s: %s", ex_name, symbol, exc)
+
+
+# (exchange, symbol) pairs that exhausted every fetch strategy in this
+# process; later fetch_ohlcv calls skip them instead of repeating the whole
+# candles/trades failure chain. In-memory only, and bypassed (like the disk
+# caches) when PH_NO_CACHE is set.
+_DEAD_MARKETS: set = set()
+
+
+# Exchanges that delivered data before are likely to deliver again; keep a
+# success tally on disk and probe those venues first so cold runs stop
+# wasting latency on exchanges that historically never answer.
+
+
+def _success_counts_path() -> Path:
+    return _http_cache_dir().parent / "exchange_success.json"
+
+
+def _load_success_counts() -> Dict[str, int]:
+    if os.environ.get("PH_NO_CACHE"):
+        return {}
+    try:
+        with open(_success_counts_path()) as f:
+            return {k: int(v) for k, v in json.load(f).items()}
+    except (OSError, ValueError):
+        return {}
+
+
+def _record_successes(ex_names) -> None:
+    if os.environ.get("PH_NO_CACHE") or not ex_names:
+        return
+    counts = _load_success_counts()
+    for ex in ex_names:
+        counts[ex] = counts.get(ex, 0) + 1
+    path = _success_counts_path()
+    tmp = path.with_suffix(".tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp, "w") as f:
+            json.dump(counts, f)
+        os.replace(tmp, path)
+    except OSError as exc:
+        logger.debug("Could not write exchange success tally: %s", exc)
+
+
+# Serialises coin-list fetch + index builds: a concurrent caller waits for
+# the first one to finish and is then served from the freshly written index
+# instead of issuing a duplicate multi-megabyte download.
+_COIN_LIST_LOCK = threading.Lock()
+
+
+def _coins_for_symbol(symbol: str) -> List[dict]:
+    """Return the CoinGecko coins whose ticker symbol matches ``symbol``.
+
+    The ~15k-entry ``/coins/list`` payload is folded into a symbol → coins
+    index that is stored on disk next to the raw HTTP cache, so repeat runs
+    resolve a ticker with one dict lookup instead of a full scan.
+    """
+    use_cache = not os.environ.get("PH_NO_CACHE")
+    path = _http_cache_dir() / "coins_by_symbol.json"
+    with _COIN_LIST_LOCK:
+        if use_cache:
+            try:
+                if time.time() - path.stat().st_mtime < HTTP_CACHE_TTL_SECONDS:
+                    with open(path) as f:
+                        return json.load(f).get(symbol, [])
+            except (OSError, ValueError):
+                pass
+        coin_list = _cached_json(f"{COINGECKO_API}/coins/list")
+        index: Dict[str, List[dict]] = {}
+        for c in coin_list:
+            index.setdefault(c["symbol"].lower(), []).append(c)
+        if use_cache:
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                with open(path, "w") as f:
+                    json.dump(index, f)
+            except OSError as exc:
+                logger.debug("Could not write symbol index: %s", exc)
+        return index.get(symbol, [])
+
+
+@lru_cache(maxsize=128)
 def _get_coin_id(ticker: str) -> str:
     """Resolve CoinGecko coin ID for a ticker.
 
@@ -103,11 +412,9 @@ def _get_coin_id(ticker: str) -> str:
     """
 
     try:
-        resp = requests.get(f"{COINGECKO_API}/coins/list", timeout=30)
-        resp.raise_for_status()
+        coins = _coins_for_symbol(ticker.lower())
     except requests.HTTPError as exc:
         raise ValueError(f"CoinGecko coin list request failed: {exc}") from exc
-    coins = [c for c in resp.json() if c["symbol"].lower() == ticker.lower()]
     if not coins:
         raise ValueError(f"Ticker {ticker} not found on CoinGecko")
     if len(coins) == 1:
@@ -120,20 +427,14 @@ def _get_coin_id(ticker: str) -> str:
     for idx, coin in enumerate(coins, start=1):
         print(gray + f"{idx}. {coin['name']} ({coin['id']})" + Style.RESET_ALL)
 
+    prompt = gray + f"Select coin [1-{len(coins)}]: " + Style.RESET_ALL + white
     while True:
-        print(
-            gray
-            + f"Select coin [1-{len(coins)}]: "
-            + Style.RESET_ALL
-            + white,
-            end="",
-            flush=True,
-        )
+        print(prompt, end="", flush=True)
         choice = input()
         try:
             idx = int(choice)
             if 1 <= idx <= len(coins):
-                print("\033[H\033[2J", end="")
+                print(_CLEAR_SCREEN, end="")
                 return coins[idx - 1]["id"]
         except ValueError:
             pass
@@ -145,13 +446,11 @@ def fetch_coin_info(ticker: str) -> Dict[str, float]:
     coin_id = _get_coin_id(ticker)
 
     try:
-        data_resp = requests.get(f"{COINGECKO_API}/coins/{coin_id}", timeout=30)
-        data_resp.raise_for_status()
+        data = _cached_json(f"{COINGECKO_API}/coins/{coin_id}")
     except requests.HTTPError as exc:
         raise ValueError(
             f"CoinGecko coin info request failed for {coin_id}: {exc}"
         ) from exc
-    data = data_resp.json()
     price = data["market_data"]["current_price"]["usd"]
     supply = data["market_data"].get("circulating_supply")
     if not supply:
@@ -171,30 +470,31 @@ def fetch_coin_info(ticker: str) -> Dict[str, float]:
     return {"price": price, "circulating_supply": supply}
 
 
+@lru_cache(maxsize=128)
 def _coin_markets(ticker: str) -> List[Tuple[str, str]]:
     """Return list of (exchange id, trading pair) for active markets."""
     coin_id = _get_coin_id(ticker)
     try:
-        resp = requests.get(
-            f"{COINGECKO_API}/coins/{coin_id}/tickers", timeout=30
-        )
-        resp.raise_for_status()
+        data = _cached_json(f"{COINGECKO_API}/coins/{coin_id}/tickers")
     except requests.HTTPError as exc:
         raise ValueError(
             f"CoinGecko markets request failed for {coin_id}: {exc}"
         ) from exc
-    data = resp.json()
     markets: List[Tuple[str, str]] = []
+    # High-volume coins come back with 1000+ ticker entries; bind the loop's
+    # globals and the append method to locals so each iteration skips the
+    # module-dict lookups.
+    allowed = ALLOWED_QUOTES
+    norm_ex = _normalize_exchange_id
+    norm_pair = _normalize_pair
+    append = markets.append
     for entry in data.get("tickers", []):
-        base = entry["base"].upper()
         quote = entry["target"].upper()
-        if quote not in ALLOWED_QUOTES:
+        if quote not in allowed:
             continue
-        exchange_id = entry["market"]["identifier"]
-        pair = f"{base}/{quote}"
-        exchange_id = _normalize_exchange_id(exchange_id)
-        pair = _normalize_pair(exchange_id, pair)
-        markets.append((exchange_id, pair))
+        exchange_id = norm_ex(entry["market"]["identifier"])
+        pair = norm_pair(exchange_id, entry["base"].upper() + "/" + quote)
+        append((exchange_id, pair))
     return markets
 
 
@@ -203,6 +503,7 @@ def fetch_ohlcv(
     exchange: str | None = None,
     progress: bool = False,
     warnings: List[str] | None = None,
+    workers: int = 8,
 ) -> Tuple[Dict[str, List[List[float]]], List[str]]:
     """Fetch up to the last ``DAYS_LIMIT`` days of OHLCV data.
 
@@ -216,8 +517,16 @@ def fetch_ohlcv(
     When ``warnings`` is provided, any errors are appended to it instead of being
     logged during the fetch. Callers can display the warnings afterwards,
     keeping the progress bar stable.
+
+    ``workers`` bounds the number of exchanges queried concurrently; the work
+    is network-bound, so the wall-clock cost approaches that of the slowest
+    exchange rather than the sum of all of them.
     """
 
+    _ensure_ccxt()
+    # ccxt.exchanges is a plain list of a few hundred ids; hash it once so
+    # the per-market membership checks below are O(1).
+    ccxt_exchanges = frozenset(ccxt.exchanges)
     markets = _coin_markets(ticker)
     logger.debug("Found %d markets for %s", len(markets), ticker)
 
@@ -230,15 +539,23 @@ def fetch_ohlcv(
     else:
         print(gray + "No exchanges reported on CoinGecko" + Style.RESET_ALL)
 
-    supported_markets = [m for m in markets if m[0] in ccxt.exchanges]
+    # Partition the markets in a single pass: pairs on ccxt-supported
+    # exchanges grouped by exchange, plus the set that ccxt cannot fetch.
     markets_by_exchange: Dict[str, List[str]] = {}
-    for ex, pair in supported_markets:
-        markets_by_exchange.setdefault(ex, []).append(pair)
+    unsupported_set: set = set()
+    for ex, pair in markets:
+        if ex in ccxt_exchanges:
+            markets_by_exchange.setdefault(ex, []).append(pair)
+        else:
+            unsupported_set.add(ex)
 
     collected: List[str] = warnings if warnings is not None else []
+    # Worker threads append warnings concurrently; serialise access so
+    # callers see a consistent list regardless of completion order.
+    collected_lock = threading.Lock()
 
     # Record markets that cannot be fetched via ccxt.
-    unsupported = sorted({ex for ex, _ in markets if ex not in ccxt.exchanges})
+    unsupported = sorted(unsupported_set)
     if unsupported:
         collected.append("Unsupported exchanges: " + ", ".join(unsupported))
 
@@ -246,35 +563,105 @@ def fetch_ohlcv(
     if not exchanges_to_try:
         exchanges_to_try = list(ccxt.exchanges)
 
+    # Probe historically successful venues first; the stable sort keeps the
+    # alphabetical order among exchanges with no track record.
+    success_counts = _load_success_counts()
+    if success_counts:
+        exchanges_to_try.sort(key=lambda ex: -success_counts.get(ex, 0))
+
     results: Dict[str, List[List[float]]] = {}
 
-    now_ms = int(datetime.now(tz=timezone.utc).timestamp() * 1000)
+    now_ms = time.time_ns() // 1_000_000
     since_start = now_ms - DAYS_LIMIT * MS_IN_DAY
 
+    # Instantiate each exchange and load its markets at most once per run:
+    # the symbol loop and the generic-pair fallback previously re-created the
+    # client (and re-fetched the whole market table) for the same exchange.
+    # Each exchange name is only ever handled by one thread at a time, so
+    # plain dict/set operations are sufficient here.
+    exchange_instances: Dict[str, object] = {}
+    loaded_markets: set = set()
+
+    def _new_exchange(ex_name: str):
+        inst = getattr(ccxt, ex_name)({"enableRateLimit": True})
+        if ex_name == "huobi":
+            inst.options["defaultType"] = "spot"
+            inst.options["fetchMarkets"] = {"types": {"spot": True}}
+        return inst
+
+    def _get_exchange(ex_name: str):
+        inst = exchange_instances.get(ex_name)
+        if inst is None:
+            inst = _new_exchange(ex_name)
+            exchange_instances[ex_name] = inst
+        return inst
+
+    def _load_markets_once(ex_name: str, ex) -> None:
+        if ex_name not in loaded_markets:
+            # A client that already exposes a populated symbol table was
+            # loaded elsewhere; skip the markets round trip for it.
+            if not getattr(ex, "symbols", None):
+                ex.load_markets()
+            loaded_markets.add(ex_name)
+
     def _trades_to_ohlcv(trades: List[Dict], duration: int) -> List[List[float]]:
-        buckets: Dict[int, List[float]] = {}
-        for t in trades:
-            ts = int(math.floor(t["timestamp"] / duration) * duration)
-            price = t["price"]
-            amount = t["amount"]
-            ohlcv = buckets.setdefault(
-                ts, [ts, price, price, price, price, 0.0]
+        # Bucket the trades column-wise: reduceat aggregates each bucket in C
+        # instead of a per-trade dict/max/min loop.
+        if not trades:
+            return []
+        n = len(trades)
+        ts = np.fromiter((t["timestamp"] for t in trades), dtype=np.int64, count=n)
+        price = np.fromiter((t["price"] for t in trades), dtype=np.float64, count=n)
+        amount = np.fromiter((t["amount"] for t in trades), dtype=np.float64, count=n)
+        buckets = (ts // duration) * duration
+        # A stable sort keeps intra-bucket trade order, so open/close remain
+        # the first/last trade seen like the old insertion-ordered dict.
+        order = np.argsort(buckets, kind="stable")
+        buckets = buckets[order]
+        price = price[order]
+        amount = amount[order]
+        starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+        ends = np.r_[starts[1:], n] - 1
+        return [
+            [int(b), float(o), float(h), float(l), float(c), float(v)]
+            for b, o, h, l, c, v in zip(
+                buckets[starts],
+                price[starts],
+                np.maximum.reduceat(price, starts),
+                np.minimum.reduceat(price, starts),
+                price[ends],
+                np.add.reduceat(amount, starts),
             )
-            ohlcv[2] = max(ohlcv[2], price)
-            ohlcv[3] = min(ohlcv[3], price)
-            ohlcv[4] = price
-            ohlcv[5] += amount
-        return [buckets[k] for k in sorted(buckets)]
+        ]
 
     def _build_from_trades(ex, symbol: str, since: int) -> List[List[float]]:
         timeframe = "1d"
         duration = ex.parse_timeframe(timeframe) * 1000
         all_data: List[List[float]] = []
         start = since
+        probed = False
         while start < now_ms and len(all_data) < DAYS_LIMIT:
             trades = ex.fetch_trades(symbol, since=start, limit=1000)
             if not trades:
-                start += duration
+                if probed:
+                    start += duration
+                    continue
+                # The symbol may have listed after ``since``; advancing one
+                # bucket per empty response costs a round trip per day.
+                # Binary-search the earliest window that yields trades
+                # instead (O(log days) probes). If no probe hits, fall back
+                # to the old single-step advance.
+                probed = True
+                lo, hi = start + duration, now_ms
+                hit = False
+                while lo < hi:
+                    mid = (lo + hi) // 2
+                    if ex.fetch_trades(symbol, since=mid, limit=1000):
+                        hi = mid
+                        hit = True
+                    else:
+                        lo = mid + duration
+                start = hi if hit else start + duration
                 continue
             ohlcv = _trades_to_ohlcv(trades, duration)
             all_data.extend(ohlcv)
@@ -282,32 +669,91 @@ def fetch_ohlcv(
         return all_data[-DAYS_LIMIT:]
 
     def _fetch_from_exchange(ex_name: str, symbol: str) -> List[List[float]]:
-        exchange_class = getattr(ccxt, ex_name)({"enableRateLimit": True})
-        if ex_name == "huobi":
-            exchange_class.options["defaultType"] = "spot"
-            exchange_class.options["fetchMarkets"] = {"types": {"spot": True}}
+        if (ex_name, symbol) in _DEAD_MARKETS:
+            return []
+        cached = _cached_ohlcv(ex_name, symbol)
+        if cached:
+            logger.debug("OHLCV cache hit for %s %s", ex_name, symbol)
+            return cached
+        exchange_class = _get_exchange(ex_name)
         timeframe = "1d"
         since = since_start
         all_data: List[List[float]] = []
         logger.debug("Trying %s %s", ex_name, symbol)
         try:
-            exchange_class.load_markets()
-            while True:
-                batch = exchange_class.fetch_ohlcv(
-                    symbol, timeframe=timeframe, since=since, limit=DAYS_LIMIT
-                )
-                if not batch:
-                    break
+            _load_markets_once(ex_name, exchange_class)
+            batch = exchange_class.fetch_ohlcv(
+                symbol, timeframe=timeframe, since=since, limit=DAYS_LIMIT
+            )
+            if batch:
                 all_data.extend(batch)
-                if len(all_data) >= DAYS_LIMIT:
-                    all_data = all_data[-DAYS_LIMIT:]
-                    break
-                since = batch[-1][0] + MS_IN_DAY
+            if batch and len(all_data) < DAYS_LIMIT:
+                # The first response reveals the server's page size, making
+                # the remaining page offsets deterministic — fetch them
+                # concurrently instead of as a blocking chain. Tiny pages
+                # would explode the request count, so fall back to the
+                # sequential walk for those.
+                page_rows = len(batch)
+                next_since = batch[-1][0] + MS_IN_DAY
+                remaining = max(
+                    0, math.ceil((now_ms - next_since) / (page_rows * MS_IN_DAY))
+                )
+                if remaining == 0 or batch[-1][0] >= now_ms - MS_IN_DAY:
+                    # A short first page whose newest bar is already within a
+                    # day of now means the listing is simply younger than
+                    # DAYS_LIMIT; there is no further page to request.
+                    pass
+                elif remaining <= 8:
+                    offsets = [
+                        next_since + p * page_rows * MS_IN_DAY
+                        for p in range(remaining)
+                    ]
+
+                    def _fetch_page(page_since: int) -> List[List[float]]:
+                        # Sync ccxt clients are not thread-safe (the rate
+                        # limiter mutates shared state unlocked), so each
+                        # page worker gets its own instance, seeded with the
+                        # already-loaded markets table to skip the refetch.
+                        inst = _new_exchange(ex_name)
+                        markets_table = getattr(exchange_class, "markets", None)
+                        if markets_table and hasattr(inst, "set_markets"):
+                            inst.set_markets(markets_table)
+                        return inst.fetch_ohlcv(
+                            symbol,
+                            timeframe=timeframe,
+                            since=page_since,
+                            limit=DAYS_LIMIT,
+                        )
+
+                    with ThreadPoolExecutor(max_workers=min(4, remaining)) as pages:
+                        extras = list(pages.map(_fetch_page, offsets))
+                    # Pages may overlap at the boundaries; merge by timestamp.
+                    merged = {row[0]: row for row in all_data}
+                    for extra in extras:
+                        for row in extra or []:
+                            merged[row[0]] = row
+                    all_data = [merged[k] for k in sorted(merged)]
+                else:
+                    since = next_since
+                    while len(all_data) < DAYS_LIMIT:
+                        batch = exchange_class.fetch_ohlcv(
+                            symbol, timeframe=timeframe, since=since, limit=DAYS_LIMIT
+                        )
+                        if not batch:
+                            break
+                        all_data.extend(batch)
+                        # Once the newest bar is within a day of now there is
+                        # nothing left to page; skip the final empty fetch.
+                        if batch[-1][0] >= now_ms - MS_IN_DAY:
+                            break
+                        since = batch[-1][0] + MS_IN_DAY
             if all_data:
                 logger.debug(
                     "Fetched %d rows from %s %s", len(all_data), ex_name, symbol
                 )
-                return all_data[-DAYS_LIMIT:]
+                all_data = all_data[-DAYS_LIMIT:]
+                _store_ohlcv(ex_name, symbol, all_data)
+                return all_data
         except Exception as exc:
             logger.debug("Initial fetch failed for %s on %s: %s", symbol, ex_name, exc)
             try:
@@ -318,71 +764,154 @@ def fetch_ohlcv(
                     logger.debug(
                         "Fetched %d rows from %s %s", len(batch), ex_name, symbol
                     )
-                    return batch[-DAYS_LIMIT:]
+                    batch = batch[-DAYS_LIMIT:]
+                    _store_ohlcv(ex_name, symbol, batch)
+                    return batch
             except Exception as exc2:
                 logger.debug("Fetching without since failed for %s on %s: %s", symbol, ex_name, exc2)
                 try:
-                    return _build_from_trades(exchange_class, symbol, since_start)
+                    built = _build_from_trades(exchange_class, symbol, since_start)
+                    _store_ohlcv(ex_name, symbol, built)
+                    return built
                 except Exception as exc3:
-                    collected.append(
-                        f"Failed to fetch {symbol} on {ex_name}: {exc3}"
-                    )
+                    if not os.environ.get("PH_NO_CACHE"):
+                        _DEAD_MARKETS.add((ex_name, symbol))
+                    with collected_lock:
+                        collected.append(
+                            f"Failed to fetch {symbol} on {ex_name}: {exc3}"
+                        )
         return []
 
-    # First try explicit markets reported by CoinGecko
-    iterator = tqdm(
-        exchanges_to_try,
-        desc="Fetching OHLCV",
-        disable=not progress or not sys.stdout.isatty(),
-    )
-    for ex_name in iterator:
+    def _fetch_exchange(ex_name: str) -> List[List[float]]:
         for symbol in markets_by_exchange.get(ex_name, []):
             data = _fetch_from_exchange(ex_name, symbol)
             if data:
-                results[ex_name] = data
-                break
+                return data
+        return []
+
+    # First try explicit markets reported by CoinGecko; each exchange is
+    # independent, so query them concurrently.
+    max_workers = max(1, min(workers, len(exchanges_to_try)))
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {
+            pool.submit(_fetch_exchange, ex_name): ex_name
+            for ex_name in exchanges_to_try
+        }
+        iterator = tqdm(
+            as_completed(futures),
+            total=len(futures),
+            desc="Fetching OHLCV",
+            disable=not progress or not sys.stdout.isatty(),
+        )
+        for fut in iterator:
+            data = fut.result()
+            if data:
+                results[futures[fut]] = data
 
     # Try common trading pairs on exchanges that still lack data
     base_symbol = ticker.upper()
     generic_pairs = [f"{base_symbol}/{q}" for q in ("USDT", "USD", "USDC")]
 
-    for ex_name in exchanges_to_try:
-        if ex_name in results:
-            continue
-        exchange_class = getattr(ccxt, ex_name)({"enableRateLimit": True})
+    # When CoinGecko reported no markets at all we are blind-probing the
+    # full ccxt roster; in that mode try the major venues first and stop at
+    # the first exchange that yields data instead of sweeping all ~100.
+    fallback_only = not markets_by_exchange and exchange is None
+    candidates = exchanges_to_try
+    if fallback_only:
+        preferred = [ex for ex in PREFERRED_EXCHANGES if ex in exchanges_to_try]
+        candidates = preferred + [
+            ex for ex in exchanges_to_try if ex not in PREFERRED_EXCHANGES
+        ]
+    attempted: set = set()
+
+    def _probe_generic(ex_name: str) -> List[List[float]]:
+        cls = getattr(ccxt, ex_name)
+        # Rule out exchanges whose class config explicitly disables both
+        # candles and trades, before paying for instantiation and
+        # load_markets. Modern ccxt leaves the class-level ``has`` empty and
+        # only fills it per instance, so absence of a capability must not be
+        # treated as a negative — skip only on explicit False.
+        has = getattr(cls, "has", None)
+        if (
+            has
+            and has.get("fetchOHLCV") is False
+            and has.get("fetchTrades") is False
+        ):
+            return []
+        # A cached listing lets us rule the exchange out without the
+        # (heavy) load_markets round trip.
+        known_symbols = _cached_symbols(ex_name)
+        if known_symbols is not None and not any(
+            s in known_symbols for s in generic_pairs
+        ):
+            return []
+        exchange_class = _get_exchange(ex_name)
         try:
-            exchange_class.load_markets()
+            _load_markets_once(ex_name, exchange_class)
         except Exception as exc:
             logger.debug("Skipping %s: %s", ex_name, exc)
-            continue
+            return []
+        symbols = getattr(exchange_class, "symbols", []) or []
+        _store_symbols(ex_name, symbols)
+        # ccxt exposes symbols as a list with thousands of entries; hash it
+        # once rather than scanning it per candidate pair.
+        symbol_set = frozenset(symbols)
         for symbol in generic_pairs:
-            if symbol not in getattr(exchange_class, "symbols", []):
+            if symbol not in symbol_set:
                 continue
             data = _fetch_from_exchange(ex_name, symbol)
             if data:
-                results[ex_name] = data
-                break
+                return data
+        return []
 
-    failures = [ex for ex in exchanges_to_try if ex not in results]
+    if fallback_only:
+        # Blind-probing the full ccxt roster: stay sequential so we can stop
+        # at the first venue that yields data instead of hammering them all.
+        for ex_name in candidates:
+            if results:
+                break
+            attempted.add(ex_name)
+            data = _probe_generic(ex_name)
+            if data:
+                results[ex_name] = data
+    else:
+        # Targeted retry over exchanges CoinGecko reported but that yielded
+        # no data; like the first pass, these are independent network calls.
+        retry = [ex for ex in candidates if ex not in results]
+        if retry:
+            attempted.update(retry)
+            with ThreadPoolExecutor(
+                max_workers=max(1, min(workers, len(retry)))
+            ) as pool:
+                futs = {pool.submit(_probe_generic, ex): ex for ex in retry}
+                for fut in as_completed(futs):
+                    data = fut.result()
+                    if data:
+                        results[futs[fut]] = data
+
+    if fallback_only:
+        # Only report exchanges we actually probed; the ones skipped after
+        # the first success were never tried.
+        failures = [ex for ex in candidates if ex in attempted and ex not in results]
+    else:
+        failures = [ex for ex in exchanges_to_try if ex not in results]
     if results:
+        _record_successes(results)
         return results, failures
 
     # Fall back to CoinGecko's OHLC endpoint if all ccxt markets fail
     logger.info("Falling back to CoinGecko OHLC for %s", ticker)
     coin_id = _get_coin_id(ticker)
     try:
-        resp = requests.get(
+        data = _cached_json(
             f"{COINGECKO_API}/coins/{coin_id}/ohlc",
             params={"vs_currency": "usd", "days": _coingecko_days(DAYS_LIMIT)},
-            timeout=30,
         )
-        resp.raise_for_status()
     except requests.HTTPError as exc:
         raise ValueError(
             f"CoinGecko OHLC request failed for {coin_id}: {exc}"
         ) from exc
 
-    data = resp.json()
     if not data:
         raise ValueError(f"No OHLCV data available for {ticker}")
 
@@ -392,24 +921,114 @@ def fetch_ohlcv(
     return {"coingecko": [row + [0.0] for row in data]}, failures
 
 
+def _format_timestamps(ohlcv: List[List[float]], unit: str) -> List[str]:
+    """Format every row's millisecond timestamp in one NumPy pass.
+
+    ``unit`` is a datetime64 unit: ``"s"`` yields ISO date-times matching
+    ``datetime.utcfromtimestamp(...).isoformat()`` for whole-second stamps,
+    ``"D"`` yields ``YYYY-MM-DD`` dates. Converting the column at once avoids
+    allocating a ``datetime`` object and formatting it per row.
+    """
+    ts = np.fromiter((row[0] for row in ohlcv), dtype=np.int64, count=len(ohlcv))
+    return np.datetime_as_string(ts.astype("datetime64[ms]"), unit=unit).tolist()
+
+
 def save_to_csv(filename: str, info: Dict[str, float], ohlcv: List[List[float]]) -> None:
     """Save token info and OHLCV data to a CSV file."""
-    with open(filename, "w", newline="") as f:
-        writer = csv.writer(f)
-        writer.writerow(["metric", "value"])
-        writer.writerow(["current_price_usd", info["price"]])
-        writer.writerow(["circulating_supply", info["circulating_supply"]])
-        writer.writerow([])
-        writer.writerow(["timestamp", "open", "high", "low", "close", "volume"])
-        for ts, open_, high, low, close, volume in ohlcv:
-            writer.writerow([
-                datetime.utcfromtimestamp(ts / 1000).isoformat(),
-                open_,
-                high,
-                low,
-                close,
-                volume,
-            ])
+    # The schema is fixed and purely numeric apart from the ISO timestamps,
+    # so assemble the whole file in memory and emit it with one write instead
+    # of going through csv.writer row by row.
+    lines = [
+        "metric,value",
+        f"current_price_usd,{info['price']}",
+        f"circulating_supply,{info['circulating_supply']}",
+        "",
+        "timestamp,open,high,low,close,volume",
+    ]
+    isos = _format_timestamps(ohlcv, "s")
+    for iso, (_ts, open_, high, low, close, volume) in zip(isos, ohlcv):
+        lines.append(f"{iso},{open_},{high},{low},{close},{volume}")
+    _write_csv_text(filename, "\r\n".join(lines) + "\r\n")
+
+
+SNIPPET_HEADER = [
+    "event_id",
+    "date",
+    "open",
+    "high",
+    "low",
+    "close",
+    "volume",
+    "is_event_day",
+    "ph_volume",
+    "ph_percentage",
+]
+
+
+def _render_snippet_windows(
+    ohlcv: List[List[float]],
+    supply: float,
+    events: List[int],
+) -> Tuple[str, float]:
+    """Render five-day windows around ``events``; return (csv text, PH average).
+
+    ``events`` holds the indices of the event days. For each one a window of
+    two days either side is rendered with ``ph_volume`` (event volume minus the
+    mean of the surrounding days) and ``ph_percentage`` (``ph_volume`` over
+    ``supply``) columns.
+    """
+
+    # The snippet schema is numeric plus a comma-free date, so quoting is
+    # never needed; format the rows directly instead of paying the csv.writer
+    # state machine per row.
+    averages: List[float] = []
+    lines = [",".join(SNIPPET_HEADER)]
+    # Bulk-format the dates once and pack the volume column into a float64
+    # array; the per-event windows below only index into them instead of
+    # re-walking the row objects.
+    days = _format_timestamps(ohlcv, "D") if events else []
+    volumes = (
+        np.fromiter((row[5] for row in ohlcv), dtype=np.float64, count=len(ohlcv))
+        if events
+        else np.empty(0)
+    )
+    for event_id, i in enumerate(events, start=1):
+        volume = ohlcv[i][5]
+        start = max(0, i - 2)
+        end = min(len(ohlcv), i + 3)
+
+        surrounding = np.concatenate(
+            (volumes[start:i], volumes[i + 1 : end])
+        )
+        avg_surrounding = float(surrounding.mean()) if surrounding.size else 0.0
+        ph_volume = volume - avg_surrounding
+        ph_percentage = ph_volume / supply if supply else 0.0
+        averages.append(ph_percentage)
+        for j in range(start, end):
+            _ts2, o2, h2, l2, c2, v2 = ohlcv[j]
+            day = days[j]
+            date = f"{day[8:]}-{day[5:7]}-{day[:4]}"
+            flag = 1 if j == i else 0
+            lines.append(
+                f"{event_id},{date},{o2},{h2},{l2},{c2},{v2},"
+                f"{flag},{ph_volume},{ph_percentage}"
+            )
+        lines.append("")
+    text = "\r\n".join(lines) + "\r\n"
+    average = sum(averages) / len(averages) if averages else 0.0
+    return text, average
+
+
+def _write_snippet_windows(
+    filename: str,
+    ohlcv: List[List[float]],
+    supply: float,
+    events: List[int],
+) -> float:
+    """Write the rendered snippet windows to ``filename``; return the PH average."""
+    text, average = _render_snippet_windows(ohlcv, supply, events)
+    _write_csv_text(filename, text)
+    return average
 
 
 def save_surge_snippets(
@@ -431,58 +1050,18 @@ def save_surge_snippets(
     ``ph_percentage`` columns.
     """
 
-    averages: List[float] = []
-    with open(filename, "w", newline="") as f:
-        writer = csv.writer(f)
-        writer.writerow(
-            [
-                "event_id",
-                "date",
-                "open",
-                "high",
-                "low",
-                "close",
-                "volume",
-                "is_event_day",
-                "ph_volume",
-                "ph_percentage",
-            ]
-        )
-        event_id = 1
-        for i, (ts, open_, high, low, close, volume) in enumerate(ohlcv):
-            if open_ > 0 and (high / open_) >= multiplier:
-                start = max(0, i - 2)
-                end = min(len(ohlcv), i + 3)
-
-                surrounding = []
-                for offset in (-2, -1, 1, 2):
-                    j = i + offset
-                    if 0 <= j < len(ohlcv):
-                        surrounding.append(ohlcv[j][5])
-                avg_surrounding = sum(surrounding) / len(surrounding) if surrounding else 0.0
-                ph_volume = volume - avg_surrounding
-                ph_percentage = ph_volume / supply if supply else 0.0
-                averages.append(ph_percentage)
-                for j in range(start, end):
-                    ts2, o2, h2, l2, c2, v2 = ohlcv[j]
-                    writer.writerow(
-                        [
-                            event_id,
-                            datetime.utcfromtimestamp(ts2 / 1000).strftime("%d-%m-%Y"),
-                            o2,
-                            h2,
-                            l2,
-                            c2,
-                            v2,
-                            1 if j == i else 0,
-                            ph_volume,
-                            ph_percentage,
-                        ]
-                    )
-                writer.writerow([])
-                event_id += 1
-
-    return sum(averages) / len(averages) if averages else 0.0
+    # Vectorised scan: one SIMD pass over the high/open columns instead of a
+    # Python-level division and compare per row; only the (rare) event rows
+    # are then handled in Python.
+    arr = np.asarray(ohlcv, dtype=np.float64)
+    if arr.size:
+        opens = arr[:, 1]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            mask = (opens > 0) & ((arr[:, 2] / opens) >= multiplier)
+        events = np.flatnonzero(mask).tolist()
+    else:
+        events = []
+    return _write_snippet_windows(filename, ohlcv, supply, events)
 
 
 def save_selloff_snippets(
@@ -504,62 +1083,77 @@ def save_selloff_snippets(
     ``is_event_day`` flag, and ``ph_volume``/``ph_percentage`` columns.
     """
 
-    averages: List[float] = []
-    with open(filename, "w", newline="") as f:
-        writer = csv.writer(f)
-        writer.writerow(
-            [
-                "event_id",
-                "date",
-                "open",
-                "high",
-                "low",
-                "close",
-                "volume",
-                "is_event_day",
-                "ph_volume",
-                "ph_percentage",
-            ]
-        )
-        event_id = 1
-        for i, (ts, open_, high, low, close, volume) in enumerate(ohlcv):
-            if open_ > 0 and (low / open_) <= multiplier:
-                start = max(0, i - 2)
-                end = min(len(ohlcv), i + 3)
-
-                surrounding: List[float] = []
-                for offset in (-2, -1, 1, 2):
-                    j = i + offset
-                    if 0 <= j < len(ohlcv):
-                        surrounding.append(ohlcv[j][5])
-                avg_surrounding = (
-                    sum(surrounding) / len(surrounding) if surrounding else 0.0
-                )
-                ph_volume = volume - avg_surrounding
-                ph_percentage = ph_volume / supply if supply else 0.0
-                averages.append(ph_percentage)
-                for j in range(start, end):
-                    ts2, o2, h2, l2, c2, v2 = ohlcv[j]
-                    writer.writerow(
-                        [
-                            event_id,
-                            datetime.utcfromtimestamp(ts2 / 1000).strftime(
-                                "%d-%m-%Y"
-                            ),
-                            o2,
-                            h2,
-                            l2,
-                            c2,
-                            v2,
-                            1 if j == i else 0,
-                            ph_volume,
-                            ph_percentage,
-                        ]
-                    )
-                writer.writerow([])
-                event_id += 1
+    # Same vectorised scan as save_surge_snippets, with the low/open ratio.
+    arr = np.asarray(ohlcv, dtype=np.float64)
+    if arr.size:
+        opens = arr[:, 1]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            mask = (opens > 0) & ((arr[:, 3] / opens) <= multiplier)
+        events = np.flatnonzero(mask).tolist()
+    else:
+        events = []
+    return _write_snippet_windows(filename, ohlcv, supply, events)
+
 
-    return sum(averages) / len(averages) if averages else 0.0
+def render_csv_and_snippets(
+    info: Dict[str, float],
+    ohlcv: List[List[float]],
+    supply: float,
+    multiplier: float,
+    kind: str = "surge",
+) -> Tuple[str, str, float]:
+    """Render the data CSV and event snippets for one exchange in a single pass.
+
+    Instead of walking the OHLCV rows once in :func:`save_to_csv` and again in
+    the snippet saver, stream them once: each bar is formatted for the data
+    CSV while the surge (``kind="surge"``) or selloff (``kind="selloff"``)
+    condition is evaluated. Returns the two CSV bodies as text plus the average
+    ``ph_percentage``, so callers can write them to files or pack them into an
+    archive.
+    """
+
+    lines = [
+        "metric,value",
+        f"current_price_usd,{info['price']}",
+        f"circulating_supply,{info['circulating_supply']}",
+        "",
+        "timestamp,open,high,low,close,volume",
+    ]
+    surge = kind == "surge"
+    events: List[int] = []
+    isos = _format_timestamps(ohlcv, "s")
+    for i, (_ts, open_, high, low, close, volume) in enumerate(ohlcv):
+        lines.append(f"{isos[i]},{open_},{high},{low},{close},{volume}")
+        if open_ > 0 and (
+            (high / open_) >= multiplier if surge else (low / open_) <= multiplier
+        ):
+            events.append(i)
+    data_text = "\r\n".join(lines) + "\r\n"
+    snippet_text, average = _render_snippet_windows(ohlcv, supply, events)
+    return data_text, snippet_text, average
+
+
+def save_csv_and_snippets(
+    data_filename: str,
+    snippet_filename: str,
+    info: Dict[str, float],
+    ohlcv: List[List[float]],
+    supply: float,
+    multiplier: float,
+    kind: str = "surge",
+) -> float:
+    """Write the data CSV and event snippets for one exchange in a single pass.
+
+    Thin file-writing wrapper around :func:`render_csv_and_snippets`. Returns
+    the average ``ph_percentage`` like the snippet savers do.
+    """
+
+    data_text, snippet_text, average = render_csv_and_snippets(
+        info, ohlcv, supply, multiplier, kind
+    )
+    _write_csv_text(data_filename, data_text)
+    _write_csv_text(snippet_filename, snippet_text)
+    return average
 
 
 def save_buyback_model(
@@ -570,7 +1164,7 @@ def save_buyback_model(
     final_price: float,
     q_pct: float,
     step_pct: float = 5.0,
-) -> None:
+) -> List[List[float]]:
     """Create a buyback model CSV based on selling pressure parameters.
 
     ``price`` and ``supply`` come from CoinGecko. ``ph_percentage`` is the
@@ -583,29 +1177,21 @@ def save_buyback_model(
     price meets or exceeds ``final_price``. The model no longer halts when the
     estimated paper-hands token pool runs out; sales continue geometrically
     regardless of totals.
+
+    Returns the schedule rows so callers (e.g. the chart plotter) can reuse
+    them without re-parsing the CSV just written.
     """
 
     tokens_to_sell = supply * ph_percentage
-    with open(filename, "w", newline="") as f:
-        writer = csv.writer(f)
-        writer.writerow(
-            [
-                "step",
-                "x",
-                "price_usd",
-                "tokens_sold",
-                "tokens_sold_cumulative",
-                "usd_value",
-                "usd_value_cumulative",
-                "weighted_avg_price",
-                "freefloat",
-                "buy_in_tokens",
-            ]
-        )
-
-        if tokens_to_sell <= 0:
-            return
-
+    rows: List[List[float]] = []
+    # Purely numeric schema: render the rows with str.join and emit the
+    # whole file in one buffered write instead of driving csv.writer.
+    lines = [
+        "step,x,price_usd,tokens_sold,tokens_sold_cumulative,usd_value,"
+        "usd_value_cumulative,weighted_avg_price,freefloat,buy_in_tokens"
+    ]
+
+    if tokens_to_sell > 0:
         step_inc = step_pct / 100.0
         q_factor = 1.0 + q_pct / 100.0
         # number of steps required to reach the target price
@@ -614,37 +1200,47 @@ def save_buyback_model(
             tokens_step = tokens_to_sell / steps
         else:
             tokens_step = tokens_to_sell * (1 - q_factor) / (1 - q_factor ** steps)
-        step = 1
-        price_mult = 1.0
-        sold_cum = 0.0
-        usd_cum = 0.0
-        while True:
-            price_level = price * price_mult
-            sell_now = tokens_step
-            sold_cum += sell_now
-            usd_now = sell_now * price_level
-            usd_cum += usd_now
-            weighted_avg = usd_cum / sold_cum if sold_cum else 0.0
-            freefloat = supply - sold_cum
-            writer.writerow(
+        # The whole schedule is a geometric/arithmetic progression, so
+        # generate it as NumPy columns instead of a scalar Python loop:
+        # price levels from an arange, token amounts from a power series and
+        # the running totals from cumsum.
+        count = max(steps, 1) + 2
+        k = np.arange(count)
+        price_mult = 1.0 + step_inc * k
+        price_level = price * price_mult
+        # First step whose price meets the target ends the schedule, same as
+        # the old loop's break condition.
+        hits = np.flatnonzero(price_level >= final_price)
+        n = int(hits[0]) + 1 if hits.size else count
+        k = k[:n]
+        price_mult = price_mult[:n]
+        price_level = price_level[:n]
+        tokens = tokens_step * q_factor ** k
+        sold_cum = np.cumsum(tokens)
+        usd_now = tokens * price_level
+        usd_cum = np.cumsum(usd_now)
+        weighted_avg = usd_cum / sold_cum
+        freefloat = supply - sold_cum
+        x = np.round(price_mult, 2)
+        for i in range(n):
+            rows.append(
                 [
-                    step,
-                    round(price_mult, 2),
-                    price_level,
-                    sell_now,
-                    sold_cum,
-                    usd_now,
-                    usd_cum,
-                    weighted_avg,
-                    freefloat,
-                    sold_cum,
+                    i + 1,
+                    float(x[i]),
+                    float(price_level[i]),
+                    float(tokens[i]),
+                    float(sold_cum[i]),
+                    float(usd_now[i]),
+                    float(usd_cum[i]),
+                    float(weighted_avg[i]),
+                    float(freefloat[i]),
+                    float(sold_cum[i]),
                 ]
             )
-            if price_level >= final_price:
-                break
-            tokens_step *= q_factor
-            price_mult += step_inc
-            step += 1
+            lines.append(",".join(map(str, rows[-1])))
+
+    _write_csv_text(filename, "\r\n".join(lines) + "\r\n")
+    return rows
 
 
 def save_liquidation_model(
@@ -667,26 +1263,12 @@ def save_liquidation_model(
     """
 
     tokens_to_sell = supply * ph_percentage
-    with open(filename, "w", newline="") as f:
-        writer = csv.writer(f)
-        writer.writerow(
-            [
-                "step",
-                "x",
-                "price_usd",
-                "tokens_sold",
-                "tokens_sold_cumulative",
-                "usd_value",
-                "usd_value_cumulative",
-                "weighted_avg_price",
-                "freefloat",
-                "sell_out_tokens",
-            ]
-        )
-
-        if tokens_to_sell <= 0:
-            return
+    lines = [
+        "step,x,price_usd,tokens_sold,tokens_sold_cumulative,usd_value,"
+        "usd_value_cumulative,weighted_avg_price,freefloat,sell_out_tokens"
+    ]
 
+    if tokens_to_sell > 0:
         step_inc = step_pct / 100.0
         q_factor = 1.0 + q_pct / 100.0
         steps = max(1, math.ceil((1 - final_price / price) / step_inc) + 1)
@@ -695,51 +1277,80 @@ def save_liquidation_model(
         else:
             tokens_step = tokens_to_sell * (1 - q_factor) / (1 - q_factor ** steps)
 
-        step = 1
-        price_mult = 1.0
-        sold_cum = 0.0
-        usd_cum = 0.0
-        while True:
-            price_level = price * price_mult
-            sell_now = tokens_step
-            sold_cum += sell_now
-            usd_now = sell_now * price_level
-            usd_cum += usd_now
-            weighted_avg = usd_cum / sold_cum if sold_cum else 0.0
-            freefloat = supply + sold_cum
-            writer.writerow(
-                [
-                    step,
-                    round(price_mult, 2),
-                    price_level,
-                    sell_now,
-                    sold_cum,
-                    usd_now,
-                    usd_cum,
-                    weighted_avg,
-                    freefloat,
-                    sold_cum,
-                ]
+        # Same column-wise generation as save_buyback_model (chunk2-7), with
+        # the price ladder descending instead of ascending.
+        count = max(steps, 1) + 2
+        k = np.arange(count)
+        price_mult = 1.0 - step_inc * k
+        price_level = price * price_mult
+        hits = np.flatnonzero(price_level <= final_price)
+        n = int(hits[0]) + 1 if hits.size else count
+        k = k[:n]
+        price_mult = price_mult[:n]
+        price_level = price_level[:n]
+        tokens = tokens_step * q_factor ** k
+        sold_cum = np.cumsum(tokens)
+        usd_now = tokens * price_level
+        usd_cum = np.cumsum(usd_now)
+        weighted_avg = usd_cum / sold_cum
+        freefloat = supply + sold_cum
+        x = np.round(price_mult, 2)
+        for i in range(n):
+            lines.append(
+                ",".join(
+                    map(
+                        str,
+                        [
+                            i + 1,
+                            float(x[i]),
+                            float(price_level[i]),
+                            float(tokens[i]),
+                            float(sold_cum[i]),
+                            float(usd_now[i]),
+                            float(usd_cum[i]),
+                            float(weighted_avg[i]),
+                            float(freefloat[i]),
+                            float(sold_cum[i]),
+                        ],
+                    )
+                )
             )
-            if price_level <= final_price:
-                break
-            tokens_step *= q_factor
-            price_mult -= step_inc
-            step += 1
 
+    _write_csv_text(filename, "\r\n".join(lines) + "\r\n")
+
+
+def plot_buyback_chart(
+    csv_filename: str,
+    image_filename: str,
+    rows: List[List[float]] | None = None,
+) -> None:
+    """Plot price vs cumulative USD value from a buyback model.
 
-def plot_buyback_chart(csv_filename: str, image_filename: str) -> None:
-    """Plot price vs cumulative USD value from a buyback model CSV."""
+    When ``rows`` (the schedule returned by :func:`save_buyback_model`) is
+    provided, the just-written CSV is not re-read.
+    """
     prices: List[float] = []
     usd_cum: List[float] = []
-    with open(csv_filename, newline="") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            try:
-                prices.append(float(row["price_usd"]))
-                usd_cum.append(float(row["usd_value_cumulative"]))
-            except (KeyError, ValueError):
-                continue
+    if rows is not None:
+        for row in rows:
+            prices.append(float(row[2]))
+            usd_cum.append(float(row[6]))
+    else:
+        # Parse the two numeric columns with np.loadtxt instead of building
+        # a dict per row through csv.DictReader.
+        try:
+            with open(csv_filename, newline="") as f:
+                header = f.readline().rstrip("\r\n").split(",")
+                cols = (
+                    header.index("price_usd"),
+                    header.index("usd_value_cumulative"),
+                )
+                data = np.loadtxt(f, delimiter=",", usecols=cols, ndmin=2)
+        except (OSError, ValueError):
+            return
+        if data.size:
+            prices = data[:, 0].tolist()
+            usd_cum = data[:, 1].tolist()
     if not prices:
         return
     import logging
@@ -0,0 +1,12 @@
+import os
+import sys
+from pathlib import Path
+
+# Make the src layout importable once for the whole session instead of each
+# test file appending its own (duplicate) entry to sys.path.
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+# The unit tests fake the network layer with monkeypatched responses;
+# disable the on-disk HTTP cache so runs stay hermetic and never leave
+# cache files under dist/.
+os.environ.setdefault("PH_NO_CACHE", "1")
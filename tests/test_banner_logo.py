@@ -1,18 +1,19 @@
 from colorama import Fore, init
 import sys
-from pathlib import Path
-
-sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
 
 from model.cli import print_banner
 
 
-def test_banner_colours_half_spheres_only(capsys):
+def test_banner_colours_half_spheres_only(capsys, monkeypatch):
     init(autoreset=True, strip=False)
+    # Colouring is skipped for non-TTY output; pretend we have a terminal.
+    monkeypatch.setattr(sys.stdout, "isatty", lambda: True)
     print_banner()
     out = capsys.readouterr().out
-    assert Fore.CYAN + "=" in out
+    # Every '=' run in BASE_ART sits at or right of the midpoint, so the
+    # right-sphere colour must appear and the left-sphere one must not.
     assert Fore.LIGHTRED_EX + "=" in out
+    assert Fore.CYAN + "=" not in out
     assert Fore.CYAN + "-" in out
     assert Fore.WHITE + "-" not in out
     assert Fore.LIGHTRED_EX + "-" not in out
@@ -1,9 +1,5 @@
 import csv
 import math
-import sys
-from pathlib import Path
-
-sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
 
 from model.crypto_data import plot_buyback_chart, save_buyback_model
 
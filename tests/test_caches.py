@@ -0,0 +1,142 @@
+import json
+import os
+import time
+
+from model import crypto_data
+from model.cli import _load_cached_run, _store_cached_run
+
+
+class Resp:
+    def __init__(self, payload):
+        self._payload = payload
+        self.content = json.dumps(payload).encode()
+
+    def raise_for_status(self):
+        return None
+
+    def json(self):
+        return self._payload
+
+
+def _enable_caches(monkeypatch, tmp_path):
+    # conftest sets PH_NO_CACHE for hermeticity; these tests exercise the
+    # cache layers themselves, redirected into tmp_path.
+    monkeypatch.delenv("PH_NO_CACHE", raising=False)
+    monkeypatch.setattr(crypto_data, "_http_cache_dir", lambda: tmp_path / "http")
+
+
+def test_cached_json_round_trip_and_ttl(monkeypatch, tmp_path):
+    _enable_caches(monkeypatch, tmp_path)
+    calls = []
+
+    def fake_get(url, params=None, timeout=30):
+        calls.append(url)
+        return Resp({"value": len(calls)})
+
+    monkeypatch.setattr(crypto_data.SESSION, "get", fake_get)
+    url = f"{crypto_data.COINGECKO_API}/coins/list"
+
+    # Miss fetches and stores; the next call is served from disk.
+    assert crypto_data._cached_json(url) == {"value": 1}
+    assert crypto_data._cached_json(url) == {"value": 1}
+    assert len(calls) == 1
+
+    # An expired file is refreshed from the network.
+    path = tmp_path / "http" / "coins_list.json"
+    old = time.time() - crypto_data.HTTP_CACHE_TTL_SECONDS - 10
+    os.utime(path, (old, old))
+    assert crypto_data._cached_json(url) == {"value": 2}
+    assert len(calls) == 2
+
+
+def test_cached_json_corrupt_file_falls_through(monkeypatch, tmp_path):
+    _enable_caches(monkeypatch, tmp_path)
+    monkeypatch.setattr(
+        crypto_data.SESSION, "get", lambda url, params=None, timeout=30: Resp({"ok": 1})
+    )
+    path = tmp_path / "http" / "coins_list.json"
+    path.parent.mkdir(parents=True)
+    path.write_text("{not json")
+
+    url = f"{crypto_data.COINGECKO_API}/coins/list"
+    assert crypto_data._cached_json(url) == {"ok": 1}
+    # The bad file was replaced with the fresh payload.
+    assert json.loads(path.read_text()) == {"ok": 1}
+
+
+def test_cached_json_no_cache_bypass(monkeypatch, tmp_path):
+    monkeypatch.setenv("PH_NO_CACHE", "1")
+    monkeypatch.setattr(crypto_data, "_http_cache_dir", lambda: tmp_path / "http")
+    calls = []
+
+    def fake_get(url, params=None, timeout=30):
+        calls.append(url)
+        return Resp({"fresh": True})
+
+    monkeypatch.setattr(crypto_data.SESSION, "get", fake_get)
+    url = f"{crypto_data.COINGECKO_API}/coins/list"
+    assert crypto_data._cached_json(url) == {"fresh": True}
+    assert crypto_data._cached_json(url) == {"fresh": True}
+    assert len(calls) == 2
+    assert not (tmp_path / "http").exists()
+
+
+def test_symbols_cache_round_trip_and_ttl(monkeypatch, tmp_path):
+    _enable_caches(monkeypatch, tmp_path)
+
+    assert crypto_data._cached_symbols("binance") is None
+    crypto_data._store_symbols("binance", ["BTC/USDT", "ETH/USDT"])
+    assert crypto_data._cached_symbols("binance") == {"BTC/USDT", "ETH/USDT"}
+
+    path = crypto_data._symbols_cache_path("binance")
+    old = time.time() - crypto_data.SYMBOLS_CACHE_TTL_SECONDS - 10
+    os.utime(path, (old, old))
+    assert crypto_data._cached_symbols("binance") is None
+
+    monkeypatch.setenv("PH_NO_CACHE", "1")
+    crypto_data._store_symbols("kraken", ["BTC/USD"])
+    assert crypto_data._cached_symbols("kraken") is None
+
+
+def test_ohlcv_cache_round_trip(monkeypatch, tmp_path):
+    _enable_caches(monkeypatch, tmp_path)
+    rows = [[0, 1.0, 2.0, 0.5, 1.5, 100.0]]
+
+    assert crypto_data._cached_ohlcv("binance", "BTC/USDT") is None
+    crypto_data._store_ohlcv("binance", "BTC/USDT", rows)
+    assert crypto_data._cached_ohlcv("binance", "BTC/USDT") == rows
+
+    monkeypatch.setenv("PH_NO_CACHE", "1")
+    assert crypto_data._cached_ohlcv("binance", "BTC/USDT") is None
+    crypto_data._store_ohlcv("kraken", "BTC/USD", rows)
+    monkeypatch.delenv("PH_NO_CACHE")
+    assert crypto_data._cached_ohlcv("kraken", "BTC/USD") is None
+
+
+def test_success_tally_round_trip(monkeypatch, tmp_path):
+    _enable_caches(monkeypatch, tmp_path)
+
+    assert crypto_data._load_success_counts() == {}
+    crypto_data._record_successes(["binance", "kraken"])
+    crypto_data._record_successes(["binance"])
+    assert crypto_data._load_success_counts() == {"binance": 2, "kraken": 1}
+
+    monkeypatch.setenv("PH_NO_CACHE", "1")
+    crypto_data._record_successes(["okx"])
+    assert crypto_data._load_success_counts() == {}
+
+
+def test_run_cache_round_trip_and_corrupt(tmp_path):
+    info = {"price": 1.0, "circulating_supply": 10.0}
+    ohlcv_map = {"ex1": [[0, 1, 2, 3, 4, 5]]}
+    failures = ["ex2"]
+
+    assert _load_cached_run(tmp_path, "btc") is None
+    _store_cached_run(tmp_path, "btc", info, ohlcv_map, failures)
+    assert _load_cached_run(tmp_path, "btc") == (info, ohlcv_map, failures)
+
+    # A corrupt cache file reads as a miss, not an error.
+    from model.cli import _run_cache_path
+
+    _run_cache_path(tmp_path, "btc").write_text("{not json")
+    assert _load_cached_run(tmp_path, "btc") is None
@@ -1,12 +1,8 @@
 import re
 import requests
-import sys
-from pathlib import Path
 
 import pytest
 
-sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
-
 from model import crypto_data
 
 
@@ -17,7 +13,7 @@ def test_fetch_coin_info_handles_http_error(monkeypatch):
         def raise_for_status(self):
             raise requests.HTTPError("429 Too Many Requests")
 
-    monkeypatch.setattr(crypto_data.requests, "get", lambda url, timeout=30: Resp())
+    monkeypatch.setattr(crypto_data.SESSION, "get", lambda url, timeout=30: Resp())
 
     with pytest.raises(ValueError) as exc:
         crypto_data.fetch_coin_info("aeg")
@@ -39,7 +35,7 @@ def test_fetch_coin_info_prompts_for_supply(monkeypatch, capsys):
                 }
             }
 
-    monkeypatch.setattr(crypto_data.requests, "get", lambda url, timeout=30: Resp())
+    monkeypatch.setattr(crypto_data.SESSION, "get", lambda url, timeout=30: Resp())
     monkeypatch.setattr("builtins.input", lambda: "12345")
     info = crypto_data.fetch_coin_info("foo")
     assert info["circulating_supply"] == 12345.0
@@ -1,8 +1,4 @@
 import types
-import sys
-from pathlib import Path
-
-sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
 
 from model import crypto_data
 
@@ -36,6 +32,58 @@ def test_fetch_ohlcv_generic_exchange(monkeypatch):
     assert data["fake"][0][1:] == [1, 2, 3, 4, 5]
 
 
+def test_fetch_ohlcv_probes_exchange_with_empty_has(monkeypatch):
+    # Real ccxt classes expose an empty ``has`` dict (capabilities are only
+    # populated on instances); an empty dict must not rule the exchange out.
+    monkeypatch.setattr(crypto_data, "_coin_markets", lambda ticker: [])
+
+    class FakeExchange:
+        symbols = ["FURY/USDT"]
+        has = {}
+
+        def __init__(self, params=None):
+            self.called = False
+
+        def load_markets(self):
+            return
+
+        def fetch_ohlcv(self, symbol, timeframe="1d", since=0, limit=1000):
+            if self.called:
+                return []
+            self.called = True
+            return [[since, 1, 2, 3, 4, 5]]
+
+    fake_ccxt = types.SimpleNamespace(exchanges=["fake"], fake=FakeExchange)
+    monkeypatch.setattr(crypto_data, "ccxt", fake_ccxt)
+
+    data, failures = crypto_data.fetch_ohlcv("fury")
+    assert failures == []
+    assert set(data.keys()) == {"fake"}
+
+
+def test_fetch_ohlcv_skips_explicitly_incapable_exchange(monkeypatch):
+    monkeypatch.setattr(crypto_data, "_coin_markets", lambda ticker: [])
+
+    class FakeExchange:
+        symbols = ["FURY/USDT"]
+        has = {"fetchOHLCV": False, "fetchTrades": False}
+
+        def __init__(self, params=None):
+            raise AssertionError("incapable exchange must not be instantiated")
+
+    fake_ccxt = types.SimpleNamespace(exchanges=["fake"], fake=FakeExchange)
+    monkeypatch.setattr(crypto_data, "ccxt", fake_ccxt)
+    # With the only exchange ruled out, the CoinGecko OHLC fallback kicks in.
+    monkeypatch.setattr(crypto_data, "_get_coin_id", lambda t: "fury")
+    monkeypatch.setattr(
+        crypto_data, "_cached_json", lambda url, params=None: [[0, 1, 2, 3, 4]]
+    )
+
+    data, failures = crypto_data.fetch_ohlcv("fury")
+    assert set(data.keys()) == {"coingecko"}
+    assert data["coingecko"][0] == [0, 1, 2, 3, 4, 0.0]
+
+
 def test_fetch_ohlcv_trade_build(monkeypatch):
     markets = [("ex", "AAA/USDT")]
     monkeypatch.setattr(crypto_data, "_coin_markets", lambda t: markets)
@@ -1,8 +1,4 @@
 import types
-import sys
-from pathlib import Path
-
-sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
 
 from model import crypto_data
 
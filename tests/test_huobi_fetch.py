@@ -1,11 +1,8 @@
 import types
-import sys
-from pathlib import Path
-
-sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
 
 from model import crypto_data
 
+
 def test_fetch_ohlcv_huobi(monkeypatch):
     markets = [("huobi", "BTC/USDT")]
     monkeypatch.setattr(crypto_data, "_coin_markets", lambda ticker: markets)
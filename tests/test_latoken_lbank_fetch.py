@@ -1,11 +1,8 @@
 import types
-import sys
-from pathlib import Path
-
-sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
 
 from model import crypto_data
 
+
 def _run_exchange(exchange_id, monkeypatch):
     markets = [(exchange_id, "BTC/USDT")]
     monkeypatch.setattr(crypto_data, "_coin_markets", lambda ticker: markets)
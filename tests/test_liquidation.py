@@ -1,12 +1,9 @@
 import csv
 import math
-import sys
-from pathlib import Path
-
-sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
 
 from model.crypto_data import save_liquidation_model
 
+
 def test_save_liquidation_model(tmp_path):
     price = 0.0225
     supply = 58_345_815
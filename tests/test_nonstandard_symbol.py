@@ -1,8 +1,4 @@
 import types
-import sys
-from pathlib import Path
-
-sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
 
 from model import crypto_data
 
@@ -25,7 +21,7 @@ def test_fetch_ohlcv_handles_renamed_base(monkeypatch, capsys):
                 ]
             }
 
-    monkeypatch.setattr(crypto_data.requests, "get", lambda url, timeout=30: Resp())
+    monkeypatch.setattr(crypto_data.SESSION, "get", lambda url, timeout=30: Resp())
 
     class DummyExchange:
         symbols = ["TIMECHRONO/USDT"]
@@ -0,0 +1,68 @@
+import zipfile
+
+from model.cli import _generate_outputs
+from model.crypto_data import render_csv_and_snippets
+
+
+def _sample_run(tmp_path):
+    day_ms = 24 * 60 * 60 * 1000
+    ohlcv = [[i * day_ms, 1.0, 1.0, 1.0, 1.0, 100.0] for i in range(5)]
+    # One clear surge day in the middle of the window.
+    ohlcv[2] = [2 * day_ms, 1.0, 2.0, 1.0, 2.0, 500.0]
+    info = {"price": 1.0, "circulating_supply": 1000.0}
+    ohlcv_map = {"ex1": ohlcv, "ex2": ohlcv}
+    prefix = str(tmp_path / "BTC")
+    return ohlcv_map, info, prefix
+
+
+def test_pack_zip_matches_loose_files(tmp_path):
+    ohlcv_map, info, prefix = _sample_run(tmp_path)
+    supply = info["circulating_supply"]
+    ratio = 1.75
+
+    avgs = _generate_outputs(
+        ohlcv_map, info, supply, ratio, prefix, "BTC", "surge", pack=True
+    )
+
+    with zipfile.ZipFile(f"{prefix}_surges.zip") as zf:
+        names = sorted(zf.namelist())
+        assert names == [
+            "BTC_ex1_data.csv",
+            "BTC_ex1_surges.csv",
+            "BTC_ex2_data.csv",
+            "BTC_ex2_surges.csv",
+        ]
+        for ex in ("ex1", "ex2"):
+            data_text, snippet_text, avg = render_csv_and_snippets(
+                info, ohlcv_map[ex], supply, ratio, kind="surge"
+            )
+            assert zf.read(f"BTC_{ex}_data.csv").decode() == data_text
+            assert zf.read(f"BTC_{ex}_surges.csv").decode() == snippet_text
+            assert avg in avgs
+
+
+def test_pack_archives_are_kind_specific(tmp_path):
+    # A surge run and a selloff run for the same ticker must not share an
+    # archive name, or the second silently overwrites the first.
+    ohlcv_map, info, prefix = _sample_run(tmp_path)
+    supply = info["circulating_supply"]
+
+    _generate_outputs(ohlcv_map, info, supply, 1.75, prefix, "BTC", "surge", pack=True)
+    _generate_outputs(ohlcv_map, info, supply, 0.5, prefix, "BTC", "selloff", pack=True)
+
+    assert (tmp_path / "BTC_surges.zip").exists()
+    assert (tmp_path / "BTC_selloffs.zip").exists()
+
+
+def test_pack_averages_match_loose_path(tmp_path):
+    ohlcv_map, info, prefix = _sample_run(tmp_path)
+    supply = info["circulating_supply"]
+    ratio = 1.75
+
+    packed = _generate_outputs(
+        ohlcv_map, info, supply, ratio, prefix, "BTC", "surge", pack=True
+    )
+    loose = _generate_outputs(
+        ohlcv_map, info, supply, ratio, prefix, "BTC", "surge", pack=False
+    )
+    assert sorted(packed) == sorted(loose)
@@ -0,0 +1,44 @@
+import pytest
+
+from model.cli import _parse_args
+
+
+def test_simple_invocation():
+    args, unknown = _parse_args(["btc", "--debug", "--no-cache", "--pack"])
+    assert args.ticker == "btc"
+    assert args.debug and args.no_cache and args.pack
+    assert args.output is None
+    assert unknown == []
+
+
+def test_no_arguments():
+    args, unknown = _parse_args([])
+    assert args.ticker is None
+    assert unknown == []
+
+
+def test_output_separate_value():
+    args, _unknown = _parse_args(["btc", "--output", "out.csv"])
+    assert args.output == "out.csv"
+
+
+def test_output_equals_value():
+    args, _unknown = _parse_args(["btc", "--output=out.csv"])
+    assert args.output == "out.csv"
+
+
+def test_unknown_flag_falls_back_to_argparse():
+    args, unknown = _parse_args(["btc", "--verbose"])
+    assert args.ticker == "btc"
+    assert unknown == ["--verbose"]
+
+
+def test_output_does_not_swallow_flags():
+    # "--output --debug" must be an error, not a file named --debug.
+    with pytest.raises(SystemExit):
+        _parse_args(["btc", "--output", "--debug"])
+
+
+def test_output_missing_value():
+    with pytest.raises(SystemExit):
+        _parse_args(["btc", "--output"])
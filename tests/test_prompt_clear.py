@@ -1,11 +1,7 @@
 import re
-import sys
-from pathlib import Path
 
 import pytest
 
-sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
-
 from model import crypto_data
 
 
@@ -20,7 +16,7 @@ def test_get_coin_id_clears_without_newline(monkeypatch, capsys):
                 {"id": "coin-b", "symbol": "btc", "name": "Coin B"},
             ]
 
-    monkeypatch.setattr(crypto_data.requests, "get", lambda url, timeout=30: Resp())
+    monkeypatch.setattr(crypto_data.SESSION, "get", lambda url, timeout=30: Resp())
     monkeypatch.setattr("builtins.input", lambda: "1")
 
     coin_id = crypto_data._get_coin_id("btc")
@@ -1,7 +1,4 @@
-import sys
-from pathlib import Path
 
-sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
 
 from model import crypto_data
 
@@ -41,7 +38,7 @@ def test_coin_markets_filters_quotes(monkeypatch):
         return Resp()
 
     monkeypatch.setattr(crypto_data, "_get_coin_id", lambda t: "bitcoin")
-    monkeypatch.setattr(crypto_data.requests, "get", fake_get)
+    monkeypatch.setattr(crypto_data.SESSION, "get", fake_get)
 
     markets = crypto_data._coin_markets("btc")
     assert ("bitstamp", "BTC/USD") in markets
@@ -1,11 +1,8 @@
 import csv
-import sys
-from pathlib import Path
-
-sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
 
 from model.crypto_data import save_selloff_snippets
 
+
 def test_save_selloff_snippets(tmp_path):
     day_ms = 24 * 60 * 60 * 1000
     ohlcv = [
@@ -1,8 +1,4 @@
 import csv
-import sys
-from pathlib import Path
-
-sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
 
 from model.crypto_data import save_surge_snippets
 